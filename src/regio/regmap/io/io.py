@@ -19,10 +19,17 @@ class Endian(enum.Enum):
 
 #---------------------------------------------------------------------------------------------------
 class IO:
+    # Units used when displaying offsets into the IO's address space.
+    offset_units = 'Bytes'
+
     def __init__(self, *pargs, **kargs):
         super().__init__(*pargs, **kargs)
         self.started = False
 
+    def offset_scale(self, data_width):
+        # Number of offset units spanned by a single data word of the given width.
+        return data_width // 8
+
     def __enter__(self):
         self.start()
 
@@ -53,6 +60,16 @@ class IO:
         value |= set_mask
         self.write(offset, size, value)
 
+    # Bulk access entry points. The whole sequence of (offset, size) accesses is handed over in a
+    # single call so that an implementation able to transfer several accesses at once can override
+    # these. By default, each access is performed individually, in order.
+    def read_many(self, accesses):
+        return [self.read(offset, size) for offset, size in accesses]
+
+    def write_many(self, accesses, value):
+        for offset, size in accesses:
+            self.write(offset, size, value)
+
     def read_region(self, region):
         return (self.read(region.offset.absolute, region.size) >> region.shift) & region.mask
 
@@ -63,11 +80,20 @@ class IO:
         mask = region.mask << region.shift
         self.update(region.offset.absolute, region.size, ~mask, (value << region.shift) & mask)
 
+#---------------------------------------------------------------------------------------------------
+# Reduce a sequence of regions to the distinct low-level accesses needed to cover them. Regions
+# sharing the same offset and size (such as a single word register and the fields within it) only
+# require a single access. The last occurrence of each access is the one kept, so that performing
+# the reduced sequence in order leaves the same final state as accessing every region in turn.
+def unique_accesses(regions):
+    accesses = [(region.offset.absolute, region.size) for region in regions]
+    return reversed(dict.fromkeys(reversed(accesses)))
+
 #---------------------------------------------------------------------------------------------------
 class IOBuffer(dict):
     def sorted(self):
-        for offset, value in sorted(self.items(), key=lambda pair: pair[0]):
-            yield (offset, value)
+        # Offsets are unique, so ordering the items as tuples only ever compares the offsets.
+        return iter(sorted(self.items()))
 
 #---------------------------------------------------------------------------------------------------
 class BufferedIO(IO):
@@ -96,6 +122,20 @@ class BufferedIO(IO):
     def write(self, offset, size, value):
         self.buffer[offset] = (size, value)
 
+    def read_region(self, region):
+        # A field starting in an upper word of a multi-word register has an offset of it's own, which
+        # won't be buffered when only the register was loaded. Take the field's words out of the
+        # register's buffered entry instead, so that both read the same data.
+        offset = region.offset.absolute
+        base = getattr(region, 'base', None)
+        if base is not None and offset not in self.buffer:
+            base = base.absolute
+            entry = self.buffer.get(base)
+            if entry is not None and offset + region.size <= base + entry[0]:
+                shift = (offset - base) * region.data_width + region.shift
+                return (entry[1] >> shift) & region.mask
+        return super().read_region(region)
+
     def load(self, offset, size):
         value = self.llio.read(offset, size)
         self.buffer[offset] = (size, value)
@@ -111,9 +151,25 @@ class BufferedIO(IO):
     def store_region(self, region, value):
         self.store(region.offset.absolute, region.size, value)
 
+    def load_regions(self, regions):
+        accesses = tuple(unique_accesses(regions))
+        buffer = self.buffer
+        for (offset, size), value in zip(accesses, self.llio.read_many(accesses)):
+            buffer[offset] = (size, value)
+
+    def store_regions(self, regions, value):
+        accesses = tuple(unique_accesses(regions))
+        buffer = self.buffer
+        for offset, size in accesses:
+            buffer[offset] = (size, value)
+        self.llio.write_many(accesses, value)
+
     def sync(self):
-        for offset, value in self.buffer.sorted():
-            self.store(offset, value[0], value[1])
+        # Write back the buffered data in order of offset. The buffer already holds the values being
+        # written, so they go straight to the low-level IO.
+        write = self.llio.write
+        for offset, (size, value) in self.buffer.sorted():
+            write(offset, size, value)
 
     def drop(self):
         self.buffer.clear()
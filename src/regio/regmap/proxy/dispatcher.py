@@ -8,7 +8,10 @@ import sys
 #---------------------------------------------------------------------------------------------------
 def zip_repeat(proxy, value):
     nproxies = len(proxy)
-    if not isinstance(value, collections.abc.Sequence):
+
+    # A single integer applied to every proxy in the group is by far the most common case. Check for
+    # it first to skip the comparatively slow check against the sequence ABC.
+    if type(value) is int or not isinstance(value, collections.abc.Sequence):
         value = itertools.repeat(value, nproxies)
     elif len(value) != nproxies:
         raise ValueError(
@@ -1,40 +1,98 @@
 #---------------------------------------------------------------------------------------------------
 __all__ = ()
 
+import ast
 import code
-import collections
-import importlib, importlib.util
+import functools
 import pathlib
 import re
 import sys
-
-import click, click.shell_completion
+import types
 
 from . import proxy, variable
 
 PROXY_TYPES = (proxy.Proxy, variable.Variable)
 
+#---------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expr):
+    # Compile the string into a code object. This is needed because the builtin eval() can only
+    # handle expressions when passed a string, but can deal with statements when passed a code
+    # object. The choice to use eval() instead of exec() is due to eval() returning a result, where
+    # as exec() always returns None.
+    # https://docs.python.org/3/library/functions.html#eval
+    # https://docs.python.org/3/library/functions.html#compile
+    # The string is parsed once up front to classify it, rather than attempting to compile it as
+    # an expression and falling back on a SyntaxError. Results are cached by source text, so
+    # repeated evaluation of the same string skips the parser and compiler entirely.
+    tree = ast.parse(expr, '<string>', 'exec')
+    if len(tree.body) == 1 and isinstance(tree.body[0], ast.Expr):
+        # The string is a pure expression.
+        return compile(ast.Expression(tree.body[0].value), '<string>', 'eval')
+
+    # The string contains statements.
+    return compile(tree, '<string>', 'exec')
+
+_SCRIPT_CODE_CACHE = {}
+
+def _compile_script(path):
+    # Cache compiled scripts by location and file status, so that a script that is run repeatedly
+    # is only read and compiled again after it has been modified.
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    try:
+        return _SCRIPT_CODE_CACHE[key]
+    except KeyError:
+        ...
+
+    # Compile from the raw bytes, which lets the compiler perform the source decoding itself
+    # (including honouring any PEP 263 encoding declaration) rather than going through a str.
+    co = compile(path.read_bytes(), '<script>', 'exec')
+
+    # Only keep the most recent compilation of any given script.
+    for k in [k for k in _SCRIPT_CODE_CACHE if k[0] == key[0]]:
+        del _SCRIPT_CODE_CACHE[k]
+    _SCRIPT_CODE_CACHE[key] = co
+
+    return co
+
 #---------------------------------------------------------------------------------------------------
 class EnvironmentVariable:
     def __init__(self, name, *pargs, **kargs):
         super().__init__(*pargs, **kargs)
 
         self._name = name
-        self._proxies = collections.OrderedDict()
+        self._proxies = {}
+
+        # Names of the proxies bound to the variable, indexed by the proxy's identity. Membership is
+        # tested by identity rather than by equality, since comparing numeric proxies would perform
+        # IO.
+        self._proxy_names = {}
 
     def __dir__(self):
         return [name for name in vars(self) if not name.startswith('_')]
 
     def __setattr__(self, name, value):
         super().__setattr__(name, value)
-        if isinstance(value, PROXY_TYPES) and value not in self._proxies.values():
-            kargs = value.___context___.kargs
-            kargs['qualbase'] = (
-                self._name + '.' + name, # qualstem
-                value.___node___.qualname, # qualroot
-                len(value.___node___.path), # qualstart
+        if isinstance(value, PROXY_TYPES) and id(value) not in self._proxy_names:
+            # The name is interned since it may have been built dynamically (via setattr() in a
+            # script) and is used as a lookup key whenever proxies are walked by name. The qualified
+            # stem is interned as well so that re-binding under the same name shares one string.
+            name = sys.intern(name)
+            node = value.___node___
+            value.___context___.kargs['qualbase'] = (
+                sys.intern(self._name + '.' + name), # qualstem
+                node.qualname, # qualroot
+                len(node.path), # qualstart
             )
+
+            # Forget the proxy being replaced (if any) before tracking the new one.
+            prev = self._proxies.get(name)
+            if prev is not None:
+                del self._proxy_names[id(prev)]
+
             self._proxies[name] = value
+            self._proxy_names[id(value)] = name
 
     def __delattr__(self, name):
         value = getattr(self, name, None)
@@ -42,6 +100,7 @@ class EnvironmentVariable:
         if name in self._proxies:
             del value.___context___.kargs['qualbase']
             del self._proxies[name]
+            del self._proxy_names[id(value)]
 
 #---------------------------------------------------------------------------------------------------
 class Environment:
@@ -53,10 +112,17 @@ class Environment:
         # shells. The idea is to quanrantine any dynamic code from being able to access the internal
         # namespaces in which the environment is embedded.
         # TODO: Look into sub-classing types.ModuleType via a custom loader for namespace control.
-        spec = importlib.machinery.ModuleSpec('__proxy_environment__', None)
-        self._mod = importlib.util.module_from_spec(spec)
+        self._mod = types.ModuleType('__proxy_environment__')
         self._namespace = vars(self._mod)
-        self._variables = collections.OrderedDict()
+        self._variables = {}
+
+        # Bumped whenever the set of variables changes, allowing cached lookups on the namespace to
+        # detect that they have gone stale.
+        self._version = 0
+
+        # Interactive shells are cached by kind once created. This allows maintaining state between
+        # invocations.
+        self._shells = {}
 
     def new_variable(self, name):
         if name in self._variables:
@@ -65,6 +131,7 @@ class Environment:
         var = EnvironmentVariable(name)
         self._variables[name] = var
         self._namespace[name] = var
+        self._version += 1
 
         return var
 
@@ -80,17 +147,26 @@ class Environment:
         # Don't suppress exceptions. Pass along to the caller.
         return False
 
-    def start(self):
-        # Start all proxies in the environment's namespace.
+    def _ios(self):
+        # Collect the IO objects of all proxies in the environment's namespace, in binding order.
+        # Many proxies generally share the same IO (one per loaded specification), so each is only
+        # listed once.
+        ios = {}
         for v in self._variables.values():
             for p in v._proxies.values():
-                proxy.start_io(p)
+                io = p.___context___.io
+                ios.setdefault(id(io), io)
+        return list(ios.values())
+
+    def start(self):
+        # Start the IO of all proxies in the environment's namespace.
+        for io in self._ios():
+            io.start()
 
     def stop(self):
-        # Stop all proxies in the environment's namespace.
-        for v in reversed(self._variables.values()):
-            for p in reversed(v._proxies.values()):
-                proxy.stop_io(p)
+        # Stop the IO of all proxies in the environment's namespace.
+        for io in reversed(self._ios()):
+            io.stop()
 
     def dump(self, paths):
         if paths:
@@ -102,11 +178,18 @@ class Environment:
 
         # Perform a verbose dump of the selected proxies.
         with self:
+            ns = self._namespace
             for names in paths:
-                # Lookup the object.
-                obj = self._mod
-                while names:
-                    obj = getattr(obj, names.pop(0))
+                # Lookup the object. The first component is taken directly from the namespace
+                # dictionary rather than going through attribute lookup on the module.
+                try:
+                    obj = ns[names[0]]
+                except KeyError:
+                    raise AttributeError(
+                        f'Environment has no variable named {names[0]!r}.') from None
+
+                for name in names[1:]:
+                    obj = getattr(obj, name)
 
                 # Display the object.
                 if isinstance(obj, proxy.Proxy):
@@ -116,18 +199,7 @@ class Environment:
     def eval(self, expressions):
         with self:
             for expr in expressions:
-                # Compile the string into a code object. This is needed because the builtin eval()
-                # can only handle expressions when passed a string, but can deal with statements
-                # when passed a code object. The choice to use eval() instead of exec() is due to
-                # eval() returning a result, where as exec() always returns None.
-                # https://docs.python.org/3/library/functions.html#eval
-                # https://docs.python.org/3/library/functions.html#compile
-                try:
-                    # The string is a pure expression.
-                    co = compile(expr, '<string>', 'eval')
-                except SyntaxError:
-                    # The string contains statements.
-                    co = compile(expr, '<string>', 'exec')
+                co = _compile_expr(expr)
 
                 # Run the code object within the environment's namespace.
                 result = eval(co, self._namespace)
@@ -138,7 +210,7 @@ class Environment:
         if not isinstance(path, pathlib.Path):
             path = pathlib.Path(path)
 
-        if not path.exists:
+        if not path.exists():
             raise FileNotFoundError(str(path))
 
         # Update the environment's namespace for execution of the script.
@@ -156,21 +228,23 @@ class Environment:
                 v['old'] = value
             ns[k] = v['new']
 
-        # Swap out the command line arguments and module search path.
+        # Swap out the command line arguments and module search path. Both are given fresh lists, so
+        # that changes made by the script don't leak into the caller's or persist after it's done.
+        rpath = path.resolve()
         sargv, sys.argv = sys.argv, list(argv)
-        spath, sys.path = sys.path, [path.parent.absolute(), *sys.path]
-
-        # Compile the script into a code object.
-        with path.open('r') as fo:
-            co = compile(fo.read(), '<script>', 'exec')
-
-        # Execute the compiled script.
-        with self:
-            exec(co, ns)
-
-        # Restore the environment.
-        sys.argv = sargv
-        sys.path = spath
+        spath, sys.path = sys.path, [str(rpath.parent), *sys.path]
+        try:
+            # Compile the script into a code object (or re-use a cached one if the file is
+            # unchanged).
+            co = _compile_script(rpath)
+
+            # Execute the compiled script.
+            with self:
+                exec(co, ns)
+        finally:
+            # Restore the environment, even if the script failed.
+            sys.argv = sargv
+            sys.path = spath
 
         for k, v in bkup.items():
             try:
@@ -181,16 +255,13 @@ class Environment:
                 ns[k] = value
 
     def python_shell(self):
-        # Create the shell or re-use the previously cached one. This allows maintaining state
-        # between invocations.
-        try:
-            shell = self._python_shell
-        except AttributeError:
+        # Create the shell or re-use the previously cached one.
+        shell = self._shells.get('python')
+        if shell is None:
             # Setup the terminal behaviour (module automatically installs input handlers).
             import readline
 
-            shell = code.InteractiveConsole(locals=self._namespace)
-            self._python_shell = shell
+            shell = self._shells['python'] = code.InteractiveConsole(locals=self._namespace)
 
         # Run the interactive shell.
         with self:
@@ -202,13 +273,10 @@ class Environment:
         except ImportError:
             raise NotImplementedError('Missing IPython module.')
 
-        # Create the shell or re-use the previously cached one. This allows maintaining state
-        # between invocations.
-        try:
-            shell = self._ipython_shell
-        except AttributeError:
-            shell = IPython.terminal.embed.InteractiveShellEmbed()
-            self._ipython_shell = shell
+        # Create the shell or re-use the previously cached one.
+        shell = self._shells.get('ipython')
+        if shell is None:
+            shell = self._shells['ipython'] = IPython.terminal.embed.InteractiveShellEmbed()
 
         # Run the interactive shell.
         with self:
@@ -220,15 +288,12 @@ class Environment:
         except ImportError:
             raise NotImplementedError('Missing ptpython module.')
 
-        # Create the shell or re-use the previously cached one. This allows maintaining state
-        # between invocations.
-        try:
-            shell = self._ptpython_shell
-        except AttributeError:
-            shell = ptpython.repl.PythonRepl(
+        # Create the shell or re-use the previously cached one.
+        shell = self._shells.get('ptpython')
+        if shell is None:
+            shell = self._shells['ptpython'] = ptpython.repl.PythonRepl(
                 get_globals=lambda: self._namespace,
                 get_locals=lambda: self._namespace)
-            self._ptpython_shell = shell
 
         # Run the interactive shell.
         with self:
@@ -240,32 +305,54 @@ class Environment:
         except ImportError:
             raise NotImplementedError('Missing ptpython and/or IPython module(s).')
 
-        try:
-            shell = self._ptipython_shell
-        except AttributeError:
-            shell = ptipython.InteractiveShellEmbed()
-            self._ptipython_shell = shell
+        # Create the shell or re-use the previously cached one.
+        shell = self._shells.get('ptipython')
+        if shell is None:
+            shell = self._shells['ptipython'] = ptipython.InteractiveShellEmbed()
 
         # Run the interactive shell.
         with self:
             shell(local_ns=self._namespace, module=self._mod)
 
 #---------------------------------------------------------------------------------------------------
-class ClickEnvironment(Environment):
-    NAME_RE = r'(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)'
-    SUBS_RE = r'(?P<subs>(\[((\d+|(\d*:\d*(:\d*)?)),)*(\d+|(\d*:\d*(:\d*)?))\])*?)'
-    PART_RE = r'(?P<suffix>' + NAME_RE + SUBS_RE + r')'
-    PARTIAL_RE = re.compile(r'^(?P<stem>.*?)' + PART_RE + r'$')
-    PATH_RE = re.compile(r'^(?P<stem>.*?)' + PART_RE + r'\.?$')
+# Patterns for splitting an object path into it's components during shell completion. Compilation is
+# deferred until first use so that invocations which never perform completion don't pay for it.
+NAME_PATTERN = r'[a-zA-Z_][a-zA-Z0-9_]*'
+SUBS_PATTERN = r'(?:\[(?:(?:\d+|(?:\d*:\d*(?::\d*)?)),)*(?:\d+|(?:\d*:\d*(?::\d*)?))\])*'
+NAME_RE = r'(?P<name>' + NAME_PATTERN + r')'
+SUBS_RE = r'(?P<subs>' + SUBS_PATTERN + r'?)'
+PART_RE = r'(?P<suffix>' + NAME_RE + SUBS_RE + r')'
+
+@functools.lru_cache(maxsize=None)
+def _partial_re():
+    return re.compile(r'^(?P<stem>.*?)' + PART_RE + r'$')
+
+@functools.lru_cache(maxsize=None)
+def _path_re():
+    # Matches the dot separated sequence of components found at the very end of a string.
+    part = NAME_PATTERN + SUBS_PATTERN
+    return re.compile(r'(?:' + part + r'\.)*(?:' + part + r')?\Z')
+
+@functools.lru_cache(maxsize=None)
+def _part_re():
+    return re.compile(r'(?P<name>' + NAME_PATTERN + r')(?P<subs>' + SUBS_PATTERN + r')')
 
+#---------------------------------------------------------------------------------------------------
+class ClickEnvironment(Environment):
     def __init__(self, parent, *pargs, **kargs):
         super().__init__(*pargs, **kargs)
 
         self.in_completion = False
+        self._completion_kargs = None
+        self._completion_cache = {}
         self._add_click_commands(parent)
 
     @staticmethod
     def main_options(main):
+        # Click is only imported once a command line environment is actually being used, keeping it
+        # off the import path for users of the plain environment.
+        import click
+
         options = (
             click.option(
                 '--verbose',
@@ -342,14 +429,14 @@ class ClickEnvironment(Environment):
 
     def _complete(self, incomplete):
         # Extract the last path component on which completion is being attempted.
-        parts = []
-        match = self.PARTIAL_RE.match(incomplete)
+        last = None
+        match = _partial_re().match(incomplete)
         if match is not None:
             stem = match['stem']
             name = match['name']
             subs = match['subs']
             if subs:
-                parts.append((name, subs))
+                last = (name, subs)
                 partial_name = ''
             else:
                 partial_name = name
@@ -357,22 +444,25 @@ class ClickEnvironment(Environment):
             stem = incomplete
             partial_name = ''
 
-        # Extract the path components leading up to the completion being attempted.
-        while True:
-            match = self.PATH_RE.match(stem)
-            if match is None:
-                break
-
-            stem = match['stem']
-            parts.append((match['name'], match['subs']))
-
-        # Perform the path lookup to find the namespace to query for the completion.
+        # Extract the path components leading up to the completion being attempted. The path at the
+        # end of the stem is located with a single search and then split into it's components in
+        # one left to right pass.
+        path = _path_re().search(stem)[0]
+        parts = [(m['name'], m['subs']) for m in _part_re().finditer(path)]
+        if last is not None:
+            parts.append(last)
+
+        # Perform the path lookup to find the namespace to query for the completion. The first
+        # component is taken directly from the namespace dictionary rather than going through
+        # attribute lookup on the module.
+        ns = self._namespace
         obj = self._mod
-        for name, subs in reversed(parts):
+        for name, subs in parts:
             try:
-                obj = getattr(obj, name)
-            except AttributeError:
+                obj = getattr(obj, name) if ns is None else ns[name]
+            except (AttributeError, KeyError):
                 return []
+            ns = None
 
             for _ in range(subs.count('[')):
                 try:
@@ -390,6 +480,8 @@ class ClickEnvironment(Environment):
 
             nstrip = len(partial_name)
             matches = [incomplete + m[nstrip:] for m in matches]
+
+        import click.shell_completion
         return [click.shell_completion.CompletionItem(m) for m in matches]
 
     def _path_complete(self, ctx, param, incomplete):
@@ -398,13 +490,27 @@ class ClickEnvironment(Environment):
         kargs = dict(main.params)
         kargs['test_io'] = 'zero'
 
-        self.in_completion = True
-        main.invoke(main.command, **kargs) # TODO: can flag be passed via kargs instead?
-        self.in_completion = False
-
-        return self._complete(incomplete)
+        # The regmap only needs to be loaded once for a given set of parameters. Re-invoking main
+        # is time consuming and would attempt to re-insert the same variables into the environment.
+        if kargs != self._completion_kargs:
+            self.in_completion = True
+            main.invoke(main.command, **kargs) # TODO: can flag be passed via kargs instead?
+            self.in_completion = False
+            self._completion_kargs = kargs
+            self._completion_cache.clear()
+
+        # Completions only depend on the loaded regmap, so they are memoized by the text being
+        # completed and the version of the environment's namespace they were computed against.
+        key = (incomplete, self._version)
+        try:
+            items = self._completion_cache[key]
+        except KeyError:
+            items = self._completion_cache[key] = self._complete(incomplete)
+        return items
 
     def _add_click_commands(self, parent):
+        import click, importlib.util
+
         @parent.command()
         @click.argument('object-paths', nargs=-1, shell_complete=self._path_complete)
         def dump(object_paths):
@@ -446,26 +552,34 @@ class ClickEnvironment(Environment):
             '''
             self.python_shell()
 
-        @shell.command()
-        def ipython():
-            '''
-            Enter the IPython shell.
-            '''
-            self.ipython_shell()
-
-        @shell.command()
-        def ptpython():
-            '''
-            Enter the Prompt Toolkit shell.
-            '''
-            self.ptpython_shell()
-
-        @shell.command()
-        def ptipython():
-            '''
-            Enter the Prompt Toolkit IPython shell.
-            '''
-            self.ptipython_shell()
+        # Only offer the optional shells whose packages are installed. Availability is checked
+        # without importing the packages, which are large and only needed once a shell is entered.
+        have_ipython = importlib.util.find_spec('IPython') is not None
+        have_ptpython = importlib.util.find_spec('ptpython') is not None
+
+        if have_ipython:
+            @shell.command()
+            def ipython():
+                '''
+                Enter the IPython shell.
+                '''
+                self.ipython_shell()
+
+        if have_ptpython:
+            @shell.command()
+            def ptpython():
+                '''
+                Enter the Prompt Toolkit shell.
+                '''
+                self.ptpython_shell()
+
+        if have_ipython and have_ptpython:
+            @shell.command()
+            def ptipython():
+                '''
+                Enter the Prompt Toolkit IPython shell.
+                '''
+                self.ptipython_shell()
 
         @parent.group()
         def completions():
@@ -500,13 +614,14 @@ class ClickEnvironment(Environment):
             self._print_completion(ctx, 'zsh')
 
     def _print_completion(self, ctx, shell):
-        prog = ctx.find_root().info_name
+        root = ctx.find_root()
+        prog = root.info_name
         var = prog.replace('-', '_').upper()
 
+        # Generate the completion script directly from click rather than spawning the shell to
+        # re-run the program with the completion environment variable set.
         # https://click.palletsprojects.com/en/8.1.x/shell-completion/#enabling-completion
-        import subprocess
-        output = subprocess.run(
-            (shell, '-c', f'_{var}_COMPLETE={shell}_source {prog}'),
-            stdout=subprocess.PIPE,
-        )
-        click.echo(output.stdout.decode())
+        import click, click.shell_completion
+        comp_cls = click.shell_completion.get_completion_class(shell)
+        comp = comp_cls(root.command, {}, prog, f'_{var}_COMPLETE')
+        click.echo(comp.source())
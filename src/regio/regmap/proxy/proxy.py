@@ -2,6 +2,7 @@
 __all__ = ()
 
 from . import dispatcher, router, variable
+from ..io import io as regmap_io
 from ..spec import address, array, field, meta, register, structure, union
 
 #---------------------------------------------------------------------------------------------------
@@ -20,58 +21,79 @@ class Proxy:
 
 #---------------------------------------------------------------------------------------------------
 class ProxyInfo:
+    __slots__ = ('single_cls', 'group_cls', 'variable_cls', 'node_types')
+
     def __init__(self, single_cls, group_cls, variable_cls, node_types):
         self.single_cls = single_cls
         self.group_cls = group_cls
         self.variable_cls = variable_cls
-        self.node_types = node_types
+        self.node_types = frozenset(node_types)
+
+# Flatten a sequence of proxy info into a mapping from node type to the first info which handles it.
+def info_by_node_type(proxy_info):
+    by_type = {}
+    for info in proxy_info:
+        for ntype in info.node_types:
+            by_type.setdefault(ntype, info)
+    return by_type
 
 #---------------------------------------------------------------------------------------------------
 class Context:
-    def __init__(self, proxy_info, pargs, kargs):
+    __slots__ = ('proxy_info', 'info_by_type', 'pargs', 'kargs')
+
+    def __init__(self, proxy_info, pargs, kargs, info_by_type=None):
         super().__init__()
 
         self.proxy_info = proxy_info
+        self.info_by_type = info_by_node_type(proxy_info) if info_by_type is None else info_by_type
         self.pargs = tuple(pargs)
         self.kargs = dict(kargs)
 
     def copy(self, *pargs, **kargs):
-        return type(self)(*pargs, self.proxy_info, tuple(self.pargs), dict(self.kargs), **kargs)
+        # The constructor already takes it's own copy of the arguments, so don't copy them here. The
+        # node type mapping is never modified, so it's shared rather than rebuilt.
+        return type(self)(
+            *pargs, self.proxy_info, self.pargs, self.kargs, self.info_by_type, **kargs)
 
     def new_proxy(self, node, chain, *pargs, **kargs):
-        ntype = type(node)
-        for info in self.proxy_info:
-            if ntype not in info.node_types:
-                continue
-
-            if chain is not None and chain.is_group:
-                return info.group_cls(node, self, chain, *pargs, **kargs)
-            return info.single_cls(node, self, chain, *pargs, **kargs)
+        info = self.info_by_type.get(type(node))
+        if info is None:
+            raise TypeError(f'Unable to match {node!r} to a proxy.')
 
-        raise TypeError(f'Unable to match {node!r} to a proxy.')
+        if chain is not None and chain.is_group:
+            return info.group_cls(node, self, chain, *pargs, **kargs)
+        return info.single_cls(node, self, chain, *pargs, **kargs)
 
 #---------------------------------------------------------------------------------------------------
 class IOContext(Context):
+    __slots__ = ('io', 'llio')
+
     def __init__(self, io, *pargs, **kargs):
         super().__init__(*pargs, **kargs)
         self.io = io
 
+        # The low-level IO underneath any buffering. This is resolved once here since the IO of a
+        # context is fixed, while variables created on the context need it every time.
+        self.llio = io.llio if isinstance(io, regmap_io.BufferedIO) else io
+
     def copy(self, io=None, *pargs, **kargs):
         return super().copy(*pargs, self.io if io is None else io, **kargs)
 
     def new_variable(self, node, chain, *pargs, **kargs):
-        ntype = type(node)
-        for info in self.proxy_info:
-            if ntype in info.node_types:
-                return info.variable_cls(node, self, chain, *pargs, **kargs)
+        info = self.info_by_type.get(type(node))
+        if info is None:
+            raise TypeError(f'Unable to match {node!r} to a variable.')
 
-        raise TypeError(f'Unable to match {node!r} to a variable.')
+        return info.variable_cls(node, self, chain, *pargs, **kargs)
 
 #---------------------------------------------------------------------------------------------------
 # Helper for instantiating a proxy for IO operations on a node.
 def for_io(spec, io, proxy_info, *pargs, **kargs):
+    return _for_io(spec, io, proxy_info, None, pargs, kargs)
+
+def _for_io(spec, io, proxy_info, info_by_type, pargs, kargs):
     # Set up the context to be shared by all proxies rooted at the given specification.
-    ctx = IOContext(io, proxy_info, pargs, kargs)
+    ctx = IOContext(io, proxy_info, pargs, kargs, info_by_type)
 
     # Create the proxy.
     return ctx.new_proxy(meta.data_get(spec), None)
@@ -115,9 +137,11 @@ FOR_IO_BY_PATH_PROXY_INFO = (
         (field.Node,),
     ),
 )
+FOR_IO_BY_PATH_INFO_BY_TYPE = info_by_node_type(FOR_IO_BY_PATH_PROXY_INFO)
 
 def for_io_by_path(spec, io, *pargs, **kargs):
-    return for_io(spec, io, FOR_IO_BY_PATH_PROXY_INFO, *pargs, **kargs)
+    return _for_io(
+        spec, io, FOR_IO_BY_PATH_PROXY_INFO, FOR_IO_BY_PATH_INFO_BY_TYPE, pargs, kargs)
 
 #---------------------------------------------------------------------------------------------------
 def start_io(proxy):
@@ -2,7 +2,6 @@
 __all__ = ()
 
 import collections.abc
-import functools
 
 from ..spec import meta
 
@@ -15,7 +14,7 @@ from ..spec import meta
 class Router:
     def __init__(self, chain, *pargs, **kargs):
         # Don't use super() here because the mixins can (and generally will) override __setattr__.
-        object.__setattr__(self, '___chain___', RouterChain() if chain is None else chain)
+        object.__setattr__(self, '___chain___', EMPTY_CHAIN if chain is None else chain)
         super().__init__(*pargs, **kargs)
 
 #---------------------------------------------------------------------------------------------------
@@ -36,110 +35,100 @@ class RouterGroup(Router):
 
 #---------------------------------------------------------------------------------------------------
 class RouterChain:
+    __slots__ = ('ops', 'length')
+
     def __init__(self, *ops):
         # The operations on the chain are applied successively from first to last. Each application
         # produces a single node, which is then passed as the input to the next operation on the
         # chain. The node returned by the last operation is the result yielded when iterating on a
         # chain. The intermediate nodes are never yielded during iteration.
-        self.ops = tuple(ops)
+        self.ops = ops
 
         # The length of a chain is interpreted as the total number of nodes it can produce, not the
         # number of operations on the chain. This distinction is due to the fact that iteration on a
         # chain yields nodes, not operations. Note that a chain consisting of one or more operations
         # may produce an empty set of nodes if at least one of the operations covers an empty range.
-        self.length = functools.reduce(lambda res, op: res * op.length, ops, 1) if ops else 0
+        length = 1 if ops else 0
+        for op in ops:
+            length *= op.length
+        self.length = length
 
     @property
     def is_group(self):
         return len(self.ops) > 0
 
     def extend(self, *ops):
-        return type(self)(*self.ops, *ops)
+        if not ops:
+            return type(self)(*self.ops)
+
+        # Build the extended chain directly, carrying over the length already computed for the
+        # existing operations rather than recomputing it from scratch.
+        length = self.length if self.ops else 1
+        for op in ops:
+            length *= op.length
+
+        chain = object.__new__(type(self))
+        chain.ops = self.ops + ops
+        chain.length = length
+        return chain
+
+    # Chains are shared between proxies (and an empty chain is shared by all proxies), so they are
+    # never modified in place. Operations are removed by building a new chain instead.
+    def replace_last(self, *ops):
+        return type(self)(*self.ops[:-1], *ops)
 
     def pop(self):
-        self.ops = self.ops[:-1]
+        return type(self)(*self.ops[:-1])
 
     def __len__(self):
         return self.length
 
     def __iter__(self):
-        return RouterChainIterator(self, False)
+        return self._iter(False)
 
     def __reversed__(self):
-        return RouterChainIterator(self, True)
+        return self._iter(True)
+
+    def _iter(self, reversed_):
+        # Handle an empty range.
+        if self.length <= 0:
+            return iter(())
+
+        # Most chains consist of a single operation, which can produce the nodes directly.
+        ops = self.ops
+        if len(ops) == 1:
+            return ops[0].apply(None, reversed_)
+        return iter_chain_ops(ops, reversed_)
 
     def iter_proxy(self, proxy, reversed_):
         # Create and start an iterator on the chain.
-        chain_iter = reversed(self) if reversed_ else iter(self)
+        chain_iter = self._iter(reversed_)
 
         # Serve the nodes produced by the chain and wrap them in an appropriate proxy.
         ctx = proxy.___context___
         for node in chain_iter:
             yield ctx.new_proxy(node, None)
 
-#---------------------------------------------------------------------------------------------------
-class RouterChainIterator:
-    def __init__(self, chain, reversed_):
-        self._ops = chain.ops
-        self._reversed = reversed_
-
-        # Setup for iterating over the chain of operations.
-        if chain.length > 0:
-            self._iters = [None] * len(chain.ops)
-            self._cursor = 0
-        else:
-            # Handle an empty range.
-            self._cursor = -1
+# Chains are immutable, so proxies that aren't routing through a group can all share the same one.
+EMPTY_CHAIN = RouterChain()
 
-    def __iter__(self):
-        # Iterators are consumable, so no need to handle restarting.
-        return self
-
-    def __next__(self):
-        cursor = self._cursor
-
-        # The iterator has been exhausted.
-        if cursor < 0:
-            raise StopIteration
-
-        # Produce the next node by successively applying each operation on the chain to the node
-        # produced by the previous one. This effectively creates an unrolled call-chain along the
-        # lines of: node = op[n-1].apply(op[n-2].apply(...op[1].apply(op[0].apply(None))))
-        ops = self._ops
-        nops = len(ops)
-        iters = self._iters
-        node = None
-        while cursor < nops:
-            # Start the next operation's iterator on the current node.
-            if iters[cursor] is None:
-                iters[cursor] = ops[cursor].apply(node, self._reversed)
-
-            # Retrieve the next node from the operation.
-            try:
-                node = next(iters[cursor])
-            except StopIteration:
-                # The current operation has been exhausted.
-                iters[cursor] = None
-
-                # Setup to advance the preceeding operation on the chain.
-                cursor -= 1
-
-                # The the entire chain has been exhausted.
-                if cursor < 0:
-                    self._cursor = -1 # In case next() is called afterwards.
-                    raise
-            else:
-                # Apply the remaining operations on the chain until reaching the end.
-                cursor += 1
-
-        # Start the next iteration cycle at the last operation on the chain until it's iterator is
-        # exhausted, at which point the preceeding operation will be advanced.
-        self._cursor = cursor - 1
-
-        return node
+#---------------------------------------------------------------------------------------------------
+def iter_chain_ops(ops, reversed_, node=None, cursor=0):
+    # Produce nodes by successively applying each operation on the chain to every node produced by
+    # the previous one. This effectively creates a set of nested loops along the lines of:
+    # for n0 in op[0].apply(None): for n1 in op[1].apply(n0): ... yield from op[n-1].apply(n[n-2])
+    # Only the nodes produced by the last operation are yielded.
+    if cursor == len(ops) - 1:
+        yield from ops[cursor].apply(node, reversed_)
+        return
+
+    for child in ops[cursor].apply(node, reversed_):
+        yield from iter_chain_ops(ops, reversed_, child, cursor + 1)
 
 #---------------------------------------------------------------------------------------------------
 class RouterChainOp:
+    __slots__ = ('node', 'length')
+
     def __init__(self, node, length):
         self.node = node
         self.length = length
@@ -149,6 +138,8 @@ class RouterChainOp:
 
 #---------------------------------------------------------------------------------------------------
 class GetattrChainOp(RouterChainOp):
+    __slots__ = ('name',)
+
     def __init__(self, node, name):
         super().__init__(node, 1)
         self.name = name
@@ -157,11 +148,14 @@ class GetattrChainOp(RouterChainOp):
         if node is None:
             node = self.node # This operation is first on the chain.
 
-        # Retrieve the attribute from the node's spec.
-        yield meta.data_get(getattr(node.spec, self.name))
+        # Retrieve the attribute from the node's spec. Since only a single node is produced, an
+        # iterator over it is returned directly rather than setting up a generator.
+        return iter((meta.data_get(node.members_map[self.name].value),))
 
 #---------------------------------------------------------------------------------------------------
 class GetitemChainOp(RouterChainOp):
+    __slots__ = ('key',)
+
     def __init__(self, node, key):
         super().__init__(node, key.length)
         self.key = key
@@ -182,7 +176,7 @@ class EmptyDir:
 #---------------------------------------------------------------------------------------------------
 class ByMemberDir:
     def __dir__(self):
-        return self.___node___.members_map.keys()
+        return self.___node___.member_names
 
 #---------------------------------------------------------------------------------------------------
 class ByMemberGetattr:
@@ -190,13 +184,14 @@ class ByMemberGetattr:
         node = self.___node___
         chain = self.___chain___
 
-        # Restrict the attribute name to members only.
+        # Restrict the attribute name to members only. The lookup is done on the node's member table
+        # rather than through the attribute descriptor on the spec, which resolves to the same
+        # member instance via the meta-data.
         # TODO: Support symbol visibility concept: public (default), hidden and transparent
-        if name not in node.members_map:
+        member = node.members_map.get(name)
+        if member is None:
             raise AttributeError(f'Attribute {name!r} is not a member name of {node.spec!r}.')
-
-        # Perform the lookup.
-        spec = getattr(node.spec, name)
+        spec = member.value
 
         # Push this operation onto the end of the current chain. This is only needed when routing on
         # a group (since getattr is singular and doesn't produce a group).
@@ -253,20 +248,23 @@ class ByIndexGetitem:
         # The key is wrapped in a tuple to indicate that it encompasses a single field. This is to
         # support the slice list syntax, since a slice list represents a range built from multiple
         # sub-ranges.
-        if partial_key is None:
+        replace = partial_key is not None
+        if not replace:
             # First application.
             partial_key = node.indexer.new_key(())
-        else:
-            # Remove the previous chain operation on the wildcarded partial key in preparation for
-            # replacing it with a new one containing the key extension from this application.
-            chain.pop()
         new_key = partial_key.extend((key,))
 
-        # Push this operation onto the end of the current chain. Since operations only need to be
-        # tracked when routing through a group, a new operation needs to be added to the chain if
-        # the new key creates a group (due to being a slice) or is already in a group.
-        if new_key.is_slice or chain.is_group:
-            chain = chain.extend(GetitemChainOp(node, new_key))
+        # On repeated applications, the previous chain operation on the wildcarded partial key is
+        # replaced by a new one containing the key extension from this application. Otherwise, push
+        # this operation onto the end of the current chain. Since operations only need to be tracked
+        # when routing through a group, an operation is only needed on the chain if the new key
+        # creates a group (due to being a slice) or is already in a group.
+        nkept = len(chain.ops) - 1 if replace else len(chain.ops)
+        if new_key.is_slice or nkept > 0:
+            op = GetitemChainOp(node, new_key)
+            chain = chain.replace_last(op) if replace else chain.extend(op)
+        elif replace:
+            chain = chain.pop()
 
         # The newly assembled key is partial. Create a new router on the current node to continue
         # partial indexing operations until the key is completed. The range of iterable items for
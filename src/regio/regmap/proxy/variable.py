@@ -1,18 +1,24 @@
 #---------------------------------------------------------------------------------------------------
 __all__ = ()
 
+import functools
+
 from ..io import io
-from ..spec import address, array, register, structure, union
+from ..spec import address, array, field, register, structure, union
 
 #---------------------------------------------------------------------------------------------------
 class Variable:
+    __slots__ = ('_node', '_chain', '_pargs', '_kargs', '_context', 'proxy')
+
     def __init__(self, node, ctx, chain, initializer=None, *pargs, **kargs):
         super().__init__()
 
         self._node = node
         self._chain = chain
-        self._pargs = tuple(pargs)
-        self._kargs = dict(kargs)
+        # The collected arguments are already a fresh tuple and dict for every call, so they're kept
+        # as-is rather than copied.
+        self._pargs = pargs
+        self._kargs = kargs
 
         # New variables are created either by using the context directly (by reference) or on a
         # buffered copy of it (by value).
@@ -25,9 +31,13 @@ class Variable:
             # TODO: Should be able to use a custom buffer based on array.array(), where the index
             #       is the register ordinal, adjusted for the first register in the sub-tree (all
             #       registers in the sub-tree will be in a contiguous ordinal range).
-            llio = ctx.io.llio if isinstance(ctx.io, io.BufferedIO) else ctx.io
-            self._context = ctx.copy(io.BufferedIO(llio))
-            self.load(initializer)
+            self._context = ctx.copy(io.BufferedIO(ctx.llio))
+
+            # Without an initializer, all registers in the hierarchy are loaded up-front to take a
+            # snapshot. A lazy variable skips this and leaves the buffer to load each register from
+            # the low-level IO on it's first read.
+            if initializer is not None or not self.config_get('lazy', False):
+                self.load(initializer)
 
         # Setup a proxy for the variable on the initialized context.
         self.proxy = self._context.new_proxy(node, chain)
@@ -55,18 +65,7 @@ class Variable:
 
     def _load_node(self, node):
         # Perform low-level IO to read all registers.
-        load_region = self._context.io.load_region
-
-        # The node is itself a register.
-        if node.region.register is not None:
-            load_region(node.region)
-            return
-
-        # The node is a container, so load all registers in it's hierarchy.
-        # TODO: Don't walk the whole sub-tree. No need to walk past a register node.
-        for child in node.descendants:
-            if child.region.register is not None:
-                load_region(child.region)
+        self._context.io.load_regions(node.register_regions)
 
     def store(self, initializer=None):
         # Write all buffered data.
@@ -91,18 +90,7 @@ class Variable:
 
     def _store_node(self, node, initializer):
         # Perform low-level IO to write all registers.
-        store_region = self._context.io.store_region
-
-        # The node is itself a register.
-        if node.region.register is not None:
-            store_region(node.region, initializer)
-            return
-
-        # The node is a container, so store all registers in it's hierarchy.
-        # TODO: Don't walk the whole sub-tree. No need to walk past a register node.
-        for child in node.descendants:
-            if child.region.register is not None:
-                store_region(child.region, initializer)
+        self._context.io.store_regions(node.register_regions, initializer)
 
     def sync(self):
         self._context.io.sync()
@@ -114,11 +102,13 @@ class Variable:
         self._context.io.flush()
 
     def config_get(self, key, default=None):
-        for kargs in (self._kargs, self._context.kargs):
-            value = kargs.get(key)
-            if value is not None:
-                return value
-        return default
+        # The variable's own arguments take precedence over the context's. The context's arguments
+        # aren't merged in ahead of time since they can change after the variable was created (such
+        # as when the environment binds a proxy on the same context to a name).
+        value = self._kargs.get(key)
+        if value is None:
+            value = self._context.kargs.get(key)
+        return default if value is None else value
 
     def __str__(self):
         # Get the formatter class to use.
@@ -130,6 +120,22 @@ class Variable:
         # Generate the formatted string.
         return str(FORMATTERS.get(name)(self))
 
+#---------------------------------------------------------------------------------------------------
+# Build the format specification for a value with the given number of digits, along with the string
+# to display in place of an undefined value. Regions are limited to a handful of distinct widths, so
+# the results are cached rather than rebuilt for every row.
+@functools.lru_cache(maxsize=256)
+def value_format(prefix, type_, digits, grouping):
+    if grouping:
+        # Groupings for 'b', 'x' and 'X' formatting are every four digits.
+        # https://docs.python.org/3/library/string.html#format-specification-mini-language
+        width = digits + (digits + 4 - 1) // 4 - 1
+        spec = f'0{width}_{type_}'
+    else:
+        width = digits
+        spec = f'0{width}{type_}'
+    return spec, prefix + '-' * width
+
 #---------------------------------------------------------------------------------------------------
 class Formatter:
     def __init__(self, var):
@@ -147,13 +153,17 @@ class Formatter:
         # Sort lexicographically or leave in the order defined in the regmap specification.
         self.path_sort = self.var.config_get('path_sort', False)
 
-        # Determine the maximum number of nibbles for consistent offset display.
+        # Determine the maximum number of nibbles for consistent offset display. The units are
+        # taken from the low-level IO underneath any buffering.
         region = var._node.region
-        self.offset_units = 'Bytes' # TODO: Get from low-level IO.
-        self.offset_scale = region.data_width // 8 # TODO: Get from low-level IO.
+        llio = var._context.llio
+        self.offset_units = llio.offset_units
+        self.offset_scale = llio.offset_scale(region.data_width)
         self.offset_nibbles = ((region.size * self.offset_scale).bit_length() + 4 - 1) // 4
+        self.offset_spec = f'0{self.offset_nibbles}x'
 
         # Determine the formatting for values.
+        self.read_values = True
         self.ignore_access = var.config_get('ignore_access', False)
         self.with_hex_grouping = var.config_get('hex_grouping', False)
         self.with_bits_grouping = var.config_get('bits_grouping', True)
@@ -181,41 +191,41 @@ class Formatter:
         return f'{value:,}'
 
     def offset(self, value):
-        value *= self.offset_scale
-        return f'0x{value:0{self.offset_nibbles}x}'
+        return '0x' + format(value * self.offset_scale, self.offset_spec)
 
     def offset_range(self, start, end):
         return self.offset(start) + ' - ' + self.offset(end)
 
     def value_hex(self, value, region):
-        if self.with_hex_grouping:
-            # Groupings for 'x' and 'X' formatting are every four digits.
-            # https://docs.python.org/3/library/string.html#format-specification-mini-language
-            width = region.nibbles + (region.nibbles + 4 - 1) // 4 - 1
-            grouping = '_'
-        else:
-            width = region.nibbles
-            grouping = ''
-        return '0x' + ('-' * width if value is None else f'{value:0{width}{grouping}x}')
+        spec, undefined = value_format('0x', 'x', region.nibbles, self.with_hex_grouping)
+        return undefined if value is None else '0x' + format(value, spec)
 
     def value_bits(self, value, region):
-        if self.with_bits_grouping:
-            # Groupings for 'b' formatting are every four digits.
-            # https://docs.python.org/3/library/string.html#format-specification-mini-language
-            width = region.width + (region.width + 4 - 1) // 4 - 1
-            grouping = '_'
-        else:
-            width = region.width
-            grouping = ''
-        return '0b' + ('-' * width if value is None else f'{value:0{width}{grouping}b}')
+        spec, undefined = value_format('0b', 'b', region.width, self.with_bits_grouping)
+        return undefined if value is None else '0b' + format(value, spec)
 
     def update_widths(self, widths, data):
         for key, value in data.items():
-            if isinstance(value, str):
-                wkey = f'w{key}'
-                widths[wkey] = max(len(value), widths.get(wkey, 0))
+            if type(value) is str:
+                wkey = 'w' + key
+                width = len(value)
+                if width > widths.get(wkey, -1):
+                    widths[wkey] = width
         return data
 
+    def column_widths(self, row_data):
+        # Gather the string data column by column, then measure the widest entry of each column in
+        # a single pass once all rows are known.
+        columns = {}
+        for data in row_data:
+            for key, value in data.items():
+                if type(value) is str:
+                    column = columns.get(key)
+                    if column is None:
+                        column = columns[key] = []
+                    column.append(value)
+        return dict(('w' + key, max(map(len, column))) for key, column in columns.items())
+
     def __str__(self):
         root = self.root
         ctx = self.var._context
@@ -226,27 +236,30 @@ class Formatter:
         # - If the variable was created on a singular node, use it.
         nodes = chain if chain.is_group else (root,)
 
-        # Setup an iterator for recursing depth-first through the regmap hierarchy.
-        def iter_nodes(node):
-            iter_fn = reversed if isinstance(node, register.Node) and not self.lsb_first else iter
-            for child in iter_fn(node.children):
-                yield child
-
-                for gchild in iter_nodes(child):
-                    yield gchild
-
         # Gather formatting data for all nodes in the variable's hierarchy.
-        col_widths = {}
+        msb_first = not self.lsb_first
         row_data = []
         for node in nodes:
             # Format the node.
-            col_data = ctx.new_variable(node, None, ...)._format_node(self, True)
-            row_data.append(self.update_widths(col_widths, col_data))
-
-            # Gather formatting data for each child node in the hierarchy.
-            for child in iter_nodes(node):
-                col_data = ctx.new_variable(child, None, ...)._format_node(self, False)
-                row_data.append(self.update_widths(col_widths, col_data))
+            row_data.append(format_node(self, ctx, node, True))
+
+            # Gather formatting data for each child node in the hierarchy. The hierarchy is walked
+            # depth-first using an explicit stack. Children are pushed in reverse of the order they
+            # are to be displayed in, so that they're popped in display order. The fields within a
+            # register are displayed from the most significant down, unless requested otherwise.
+            stack = []
+            while True:
+                children = node.children
+                if msb_first and isinstance(node, register.Node):
+                    stack.extend(children)
+                else:
+                    stack.extend(reversed(children))
+                if not stack:
+                    break
+
+                node = stack.pop()
+                row_data.append(format_node(self, ctx, node, False))
+        col_widths = self.column_widths(row_data)
 
         # Sort the row data by path instead of by node ordering the hierarchy.
         if self.path_sort:
@@ -258,6 +271,22 @@ class Formatter:
         # Setup heading separators to frame the row strings.
         return '\n'.join(rows)
 
+#---------------------------------------------------------------------------------------------------
+# Stand-in for a column's data when formatting a row format template. Formats back into a replacement
+# field carrying the resolved format specification (such as alignment and width) for the column.
+class ColumnField:
+    def __init__(self, name):
+        self.name = name
+
+    def __format__(self, spec):
+        return '{' + self.name + ':' + spec + '}'
+
+#---------------------------------------------------------------------------------------------------
+# Row data for a table. Columns missing from a row are displayed as empty.
+class TableRow(dict):
+    def __missing__(self, key):
+        return ''
+
 #---------------------------------------------------------------------------------------------------
 class TableFormatter(Formatter):
     COLUMN_HEADINGS = {
@@ -335,11 +364,12 @@ class TableFormatter(Formatter):
         self.col_align = col_align
         self.row_fmt = row_fmt
 
-    def update_widths(self, widths, data):
-        # Insert a column for each missing header to ensure a width is calculated for everything.
-        data.update((h, '') for h in set(self.COLUMN_HEADINGS).difference(data))
-
-        return super().update_widths(widths, data)
+    def column_widths(self, row_data):
+        # Ensure a width is calculated for every column, even if it's missing from all rows.
+        widths = super().column_widths(row_data)
+        for key in self.COLUMN_HEADINGS:
+            widths.setdefault('w' + key, 0)
+        return widths
 
     def format_rows(self, row_data, col_widths):
         # Dump the column layout only.
@@ -378,11 +408,16 @@ class TableFormatter(Formatter):
         row_data.insert(0, self.update_widths(col_widths, self.COLUMN_HEADINGS))
         row_data.insert(1, self.update_widths(col_widths, units))
 
+        # Bake the alignment and width of every column into the row format, leaving only the column
+        # data to be substituted for each row.
+        fields = dict((name, ColumnField(name)) for name in self.COLUMN_FORMATS)
+        row_fmt = self.row_fmt.format(**fields, **col_widths, **self.col_align)
+
         # Generate a string for each row.
         width = 0
         rows = []
         for col_data in row_data:
-            row = self.row_fmt.format(**col_data, **col_widths, **self.col_align)
+            row = row_fmt.format_map(TableRow(col_data))
             width = max(width, len(row))
             rows.append(row)
 
@@ -402,6 +437,9 @@ class PathFormatter(Formatter):
         # Force qualnames to be absolute.
         self.abspath = True
 
+        # Only the paths are displayed, so there's no need to read any register or field values.
+        self.read_values = False
+
     def format_rows(self, row_data, col_widths):
         return [col_data['path'] for col_data in row_data]
 
@@ -424,138 +462,181 @@ FORMATTERS = {
     'table': TableFormatter,
 }
 
+#---------------------------------------------------------------------------------------------------
+# The nodes are formatted by plain functions taking the node and the context to read it's value from.
+# This allows the formatter to walk a hierarchy without creating a variable (and proxy) per node.
+STRUCTURE_TYPE_NAMES = {
+    address.Node: 'Address Space',
+    array.ElementNode: 'Array Element',
+    structure.Node: 'Structure',
+    union.Node: 'Union',
+}
+
+def format_structure(formatter, ctx, node, is_root=True):
+    ntype = type(node)
+    type_ = STRUCTURE_TYPE_NAMES.get(ntype)
+    if type_ is None:
+        raise TypeError(f'Unknown node type {ntype!r}.')
+
+    region = node.region
+    start = region.offset.absolute
+    end = start + region.size - 1
+
+    return {
+        'type': type_,
+        'path': formatter.qualname(node, is_root),
+        'size': formatter.size(region.size),
+        'offset': formatter.offset_range(start, end),
+        'data': {
+            'oid': region.oid,
+            'ordinal': region.ordinal,
+            'register': region.register,
+            'data_width': region.data_width,
+            'offset': start,
+            'size': region.size,
+            'nibbles': region.nibbles,
+            'octets': region.octets,
+        },
+    }
+
+def format_array(formatter, ctx, node, is_root=True):
+    region = node.region
+    start = region.offset.absolute
+    end = start + region.size - 1
+    qualname = formatter.qualname(node, is_root)
+    subscripts = ''.join(f'[:{f}]' for f in node.indexer.fields)
+
+    return {
+        'type': 'Array',
+        'path': f'{qualname}{subscripts}',
+        'size': formatter.size(region.size),
+        'offset': formatter.offset_range(start, end),
+        'data': {
+            'oid': region.oid,
+            'ordinal': region.ordinal,
+            'register': region.register,
+            'data_width': region.data_width,
+            'offset': start,
+            'size': region.size,
+            'nibbles': region.nibbles,
+            'octets': region.octets,
+        },
+    }
+
+def format_register(formatter, ctx, node, is_root=True):
+    region = node.region
+    access = node.config.access
+    readable = formatter.ignore_access or access.is_readable
+    value = ctx.io.read_region(region) if formatter.read_values and readable else None
+    offset = region.offset.absolute
+
+    return {
+        'type': 'Register',
+        'access': access.name,
+        'path': formatter.qualname(node, is_root),
+        'size': formatter.size(region.size),
+        'offset': formatter.offset(offset),
+        'value_hex': formatter.value_hex(value, region),
+        'data': {
+            'oid': region.oid,
+            'ordinal': region.ordinal,
+            'register': region.register,
+            'data_width': region.data_width,
+            'access': access.value,
+            'offset': offset,
+            'size': region.size,
+            'value': value,
+            'width': region.width,
+            'mask': region.mask,
+            'shift': region.shift,
+            'nibbles': region.nibbles,
+            'octets': region.octets,
+        },
+    }
+
+def format_field(formatter, ctx, node, is_root=True):
+    region = node.region
+    access = node.config.access
+    readable = formatter.ignore_access or access.is_readable
+    value = ctx.io.read_region(region) if formatter.read_values and readable else None
+
+    pos = region.pos.absolute
+    range_ = f'{pos}'
+    if region.width > 1:
+        end = pos + region.width - 1
+        range_ = f'{end}:' + range_
+
+    return {
+        'type': 'Field',
+        'access': access.name,
+        'path': formatter.qualname(node, is_root),
+        'range': f'[{range_}]',
+        'value_hex': formatter.value_hex(value, region),
+        'value_bits': formatter.value_bits(value, region),
+        'data': {
+            'oid': region.oid,
+            'ordinal': region.ordinal,
+            'register': region.register,
+            'data_width': region.data_width,
+            'access': access.value,
+            'offset': region.offset.absolute,
+            'size': region.size,
+            'value': value,
+            'pos': pos,
+            'width': region.width,
+            'mask': region.mask,
+            'shift': region.shift,
+            'nibbles': region.nibbles,
+            'octets': region.octets,
+        },
+    }
+
+FORMAT_NODE = {
+    address.Node: format_structure,
+    array.ElementNode: format_structure,
+    structure.Node: format_structure,
+    union.Node: format_structure,
+    array.Node: format_array,
+    register.Node: format_register,
+    field.Node: format_field,
+}
+
+def format_node(formatter, ctx, node, is_root=True):
+    fmt = FORMAT_NODE.get(type(node))
+    if fmt is None:
+        raise TypeError(f'Unknown node type {type(node)!r}.')
+    return fmt(formatter, ctx, node, is_root)
+
 #---------------------------------------------------------------------------------------------------
 class StructureFormatter:
+    __slots__ = ()
+
     def _format_node(self, formatter, is_root=True):
-        ntype = type(self._node)
-        if ntype is address.Node:
-            type_ = 'Address Space'
-        elif ntype is array.ElementNode:
-            type_ = 'Array Element'
-        elif ntype is structure.Node:
-            type_ = 'Structure'
-        elif ntype is union.Node:
-            type_ = 'Union'
-        else:
-            raise TypeError(f'Unknown node type {ntype!r}.')
-
-        region = self._node.region
-        start = region.offset.absolute
-        end = region.offset.absolute + region.size - 1
-
-        return {
-            'type': type_,
-            'path': formatter.qualname(self._node, is_root),
-            'size': formatter.size(region.size),
-            'offset': formatter.offset_range(start, end),
-            'data': {
-                'oid': region.oid,
-                'ordinal': region.ordinal,
-                'register': region.register,
-                'data_width': region.data_width,
-                'offset': region.offset.absolute,
-                'size': region.size,
-                'nibbles': region.nibbles,
-                'octets': region.octets,
-            },
-        }
+        return format_structure(formatter, self._context, self._node, is_root)
 
 #---------------------------------------------------------------------------------------------------
 class ArrayFormatter:
+    __slots__ = ()
+
     def _format_node(self, formatter, is_root=True):
-        region = self._node.region
-        start = region.offset.absolute
-        end = region.offset.absolute + region.size - 1
-        qualname = formatter.qualname(self._node, is_root)
-        subscripts = ''.join(f'[:{f}]' for f in self._node.indexer.fields)
-
-        return {
-            'type': 'Array',
-            'path': f'{qualname}{subscripts}',
-            'size': formatter.size(region.size),
-            'offset': formatter.offset_range(start, end),
-            'data': {
-                'oid': region.oid,
-                'ordinal': region.ordinal,
-                'register': region.register,
-                'data_width': region.data_width,
-                'offset': region.offset.absolute,
-                'size': region.size,
-                'nibbles': region.nibbles,
-                'octets': region.octets,
-            },
-        }
+        return format_array(formatter, self._context, self._node, is_root)
 
 #---------------------------------------------------------------------------------------------------
 class RegisterFormatter:
+    __slots__ = ()
+
     def _format_node(self, formatter, is_root=True):
-        region = self._node.region
-        access = self._node.config.access
-        value = int(self.proxy) if formatter.ignore_access or access.is_readable else None
-
-        return {
-            'type': 'Register',
-            'access': self._node.config.access.name,
-            'path': formatter.qualname(self._node, is_root),
-            'size': formatter.size(region.size),
-            'offset': formatter.offset(region.offset.absolute),
-            'value_hex': formatter.value_hex(value, region),
-            'data': {
-                'oid': region.oid,
-                'ordinal': region.ordinal,
-                'register': region.register,
-                'data_width': region.data_width,
-                'access': self._node.config.access.value,
-                'offset': region.offset.absolute,
-                'size': region.size,
-                'value': value,
-                'width': region.width,
-                'mask': region.mask,
-                'shift': region.shift,
-                'nibbles': region.nibbles,
-                'octets': region.octets,
-            },
-        }
+        return format_register(formatter, self._context, self._node, is_root)
 
 #---------------------------------------------------------------------------------------------------
 class FieldFormatter:
+    __slots__ = ()
+
     def _format_node(self, formatter, is_root=True):
-        region = self._node.region
-        access = self._node.config.access
-        value = int(self.proxy) if formatter.ignore_access or access.is_readable else None
-
-        range_ = f'{region.pos.absolute}'
-        if region.width > 1:
-            end = region.pos.absolute + region.width - 1
-            range_ = f'{end}:' + range_
-
-        return {
-            'type': 'Field',
-            'access': self._node.config.access.name,
-            'path': formatter.qualname(self._node, is_root),
-            'range': f'[{range_}]',
-            'value_hex': formatter.value_hex(value, region),
-            'value_bits': formatter.value_bits(value, region),
-            'data': {
-                'oid': region.oid,
-                'ordinal': region.ordinal,
-                'register': region.register,
-                'data_width': region.data_width,
-                'access': self._node.config.access.value,
-                'offset': region.offset.absolute,
-                'size': region.size,
-                'value': value,
-                'pos': region.pos.absolute,
-                'width': region.width,
-                'mask': region.mask,
-                'shift': region.shift,
-                'nibbles': region.nibbles,
-                'octets': region.octets,
-            },
-        }
+        return format_field(formatter, self._context, self._node, is_root)
 
 #---------------------------------------------------------------------------------------------------
-class StructureVariable(Variable, StructureFormatter): ...
-class ArrayVariable(Variable, ArrayFormatter): ...
-class RegisterVariable(Variable, RegisterFormatter): ...
-class FieldVariable(Variable, FieldFormatter): ...
+class StructureVariable(Variable, StructureFormatter): __slots__ = ()
+class ArrayVariable(Variable, ArrayFormatter): __slots__ = ()
+class RegisterVariable(Variable, RegisterFormatter): __slots__ = ()
+class FieldVariable(Variable, FieldFormatter): __slots__ = ()
@@ -1,6 +1,8 @@
 #---------------------------------------------------------------------------------------------------
 __all__ = ()
 
+import itertools
+
 from . import meta, structure, tree
 from ..types import config, indexing
 
@@ -29,10 +31,13 @@ class Node(tree.Node):
         self.indexer = indexing.CArrayIndexer(self.config.dimensions)
 
         # Instantiate each element in the array. The resulting nodes will be added as children
-        # according to the ordering dictated by the indexer (as a flattened C-style array).
-        data = meta.data_get(type(self.spec))
-        for index in self.indexer:
-            data.element_cls(''.join(f'[{i}]' for i in index), self.spec, index)
+        # according to the ordering dictated by the indexer (as a flattened C-style array). The
+        # indices are generated with itertools.product, which increments the last dimension first,
+        # matching the indexer's ordering without going through it's key iterator.
+        element_cls = meta.data_get(type(self.spec)).element_cls
+        spec = self.spec
+        for index in itertools.product(*map(range, self.indexer.fields)):
+            element_cls('[' + ']['.join(map(str, index)) + ']', spec, index)
 
     def init_region(self, region):
         # Set the base offset in the outer region.
@@ -97,7 +102,7 @@ class ElementNode(structure.Node):
         self.ordinal = self.parent.indexer.to_ordinal(self.index)
         super().members_init()
 
-    def qualname_from(self, start):
+    def build_qualname_from(self, start):
         qualname = self.parent.qualname_from(start)
         if not qualname:
             qualname = self.parent.name
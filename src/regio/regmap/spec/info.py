@@ -18,11 +18,13 @@ from . import meta
 #---------------------------------------------------------------------------------------------------
 def _node_from_index(spec, index):
     node = meta.data_get(spec)
-    if index is not None:
-        if isinstance(index, collections.abc.Sequence):
-            index = node.indexer.to_ordinal(index)
-        node = node.children[index]
-    return node
+    if index is None:
+        return node
+
+    # A plain integer is already an ordinal. Anything else is checked for a multi-field index.
+    if type(index) is not int and isinstance(index, collections.abc.Sequence):
+        index = node.indexer.to_ordinal(index)
+    return node.children[index]
 
 #---------------------------------------------------------------------------------------------------
 def region_of(spec, index=None):
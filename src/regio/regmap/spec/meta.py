@@ -1,13 +1,16 @@
 #---------------------------------------------------------------------------------------------------
 __all__ = ()
 
+import functools
+import sys
+
 from . import tree
 from ..types import meta
 
 #---------------------------------------------------------------------------------------------------
-# Accessor for retrieving class or instance meta-data.
-def data_get(spec):
-    return meta.data_get(spec)
+# Accessor for retrieving class or instance meta-data. Bound directly to the generic accessor rather
+# than wrapped, since it's called on every routing operation through a proxy.
+data_get = meta.data_get
 
 #---------------------------------------------------------------------------------------------------
 # The following is a list of attribute names that are writeable on all regmap types and instances.
@@ -29,6 +32,7 @@ class Data(meta.Data):
         super().__init__(*pargs, **kargs)
 
         self.config = None
+        self._member_names = None
         if metabase is None:
             self.config_cls = None
             self.node_cls = None
@@ -41,6 +45,16 @@ class Data(meta.Data):
     def new(self, spec, *pargs, **kargs):
         return self.node_cls(spec, self.members, self.config, *pargs, **kargs)
 
+    @property
+    def member_names(self):
+        # The member names are shared by every instance of the class, so they're only gathered once.
+        # The members table is final once the class has been created, which is always the case by
+        # the time an instance needs the names.
+        names = self._member_names
+        if names is None:
+            names = self._member_names = tuple(m.name for m in self.members)
+        return names
+
 #---------------------------------------------------------------------------------------------------
 class Type(meta.Type):
     def __setattr__(cls, name, value):
@@ -49,6 +63,27 @@ class Type(meta.Type):
         else:
             raise AttributeError(f'Cannot set {name!r} attribute of type {metacls!r}.')
 
+#---------------------------------------------------------------------------------------------------
+# Merge the configuration data inherited from the given bases (all sharing Object's meta-class or one
+# derived from it), in MRO order. Many classes in a regmap specification derive from the same bases
+# (such as a set of registers sub-classing Register directly), so the merged data is cached. The
+# cache is unbounded, since it only holds entries for classes which live as long as the program.
+@functools.lru_cache(maxsize=None)
+def inherited_config(data_type, bases):
+    config_kargs = {}
+    for base in reversed(bases):
+        bdata = data_get(base)
+
+        # Only inherit configuration from bases with the same meta-data type. This prevents mixing
+        # configuration keywords while allowing members to be merged.
+        if not issubclass(data_type, type(bdata)) or bdata.config is None:
+            continue
+
+        # Accumulate configuration data over all bases. Data is merged such that data from the tail
+        # of the MRO linearization are overridden by those closer to the head.
+        config_kargs.update(bdata.config.changed_map)
+    return config_kargs
+
 #---------------------------------------------------------------------------------------------------
 class Object(meta.Object, metaclass=Type, metadata=Data):
     def __init_subclass__(cls, metainfo=None, **kargs):
@@ -64,22 +99,10 @@ class Object(meta.Object, metaclass=Type, metadata=Data):
         if data.config_cls is None:
             return
 
-        # Find all bases that share Object's meta-class or one derived from it.
-        bases = [b for b in cls.__mro__ if isinstance(b, Type)]
-
-        # Accumulate inherited data from the bases.
-        config_kargs = {}
-        for base in reversed(bases):
-            bdata = data_get(base)
-
-            # Only inherit configuration from bases with the same meta-data type. This prevents
-            # mixing configuration keywords while allowing members to be merged.
-            if not issubclass(type(data), type(bdata)) or bdata.config is None:
-                     continue
-
-            # Accumulate configuration data over all bases. Data is merged such that data from the
-            # tail of the MRO linearization are overridden by those closer to the head.
-            config_kargs.update(bdata.config.changed_map)
+        # Accumulate inherited data from the bases. The class itself is left out since it has yet to
+        # be configured.
+        bases = tuple(b for b in cls.__mro__[1:] if isinstance(b, Type))
+        config_kargs = dict(inherited_config(type(data), bases))
 
         # Capture any extra keyword arguments given to the definition of the sub-class itself. This
         # data takes precedence over everything inherited by the bases.
@@ -96,7 +119,9 @@ class Object(meta.Object, metaclass=Type, metadata=Data):
 
         # Link the node into the parent's tree hierarchy or set it up as the root of it's own.
         node = data_get(self)
-        node.name = type(self).__name__ if name is None else name
+        # Names are interned since they're used as lookup keys for members and many are generated
+        # (such as the subscripts naming array elements), which would otherwise not be shared.
+        node.name = type(self).__name__ if name is None else sys.intern(name)
         pnode = tree.Root() if parent is None else data_get(parent)
         pnode.add(node)
 
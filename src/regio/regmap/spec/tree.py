@@ -1,7 +1,7 @@
 #---------------------------------------------------------------------------------------------------
 __all__ = ()
 
-from ..types import tree
+from ..types import meta, tree
 
 #---------------------------------------------------------------------------------------------------
 class Base(tree.Node):
@@ -10,17 +10,27 @@ class Base(tree.Node):
 
         self.name = ''
         self.path = ()
+        self.qualnames = {}
 
     def attach(self, parent):
         super().attach(parent)
 
         # Set the node's path in the hierarchy.
         self.path = parent.path + (self.name,)
+        self.qualnames.clear()
 
     def detach(self):
         raise NotImplementedError
 
     def qualname_from(self, start):
+        # Nodes can't be detached, so a node's qualified names are fixed once it's in the hierarchy.
+        # Cache them by starting position to avoid rebuilding the string up the tree on every use.
+        qualname = self.qualnames.get(start)
+        if qualname is None:
+            qualname = self.qualnames[start] = self.build_qualname_from(start)
+        return qualname
+
+    def build_qualname_from(self, start):
         count = len(self.path)
         if start >= count:
             return ''
@@ -45,8 +55,10 @@ class Node(Base):
         self.spec = spec
         self.members = members
         self.members_map = {}
+        self.member_names = ()
         self.config = config
         self.region = None
+        self._register_regions = None
 
     def attach(self, parent):
         super().attach(parent)
@@ -55,5 +67,36 @@ class Node(Base):
         self.members_init()
 
     def members_init(self):
+        # The member names are shared by every instance of the same class, so they're taken from the
+        # class meta-data rather than gathered per node.
+        names = meta.data_get(type(self.spec)).member_names
         self.members = tuple(m(m.name, self.spec) for m in self.members)
-        self.members_map = dict((m.name, m) for m in self.members)
+        self.members_map = dict(zip(names, self.members))
+        self.member_names = names
+
+    @property
+    def register_regions(self):
+        # Regions of all registers within the node's hierarchy. The hierarchy is fixed once a spec
+        # has been counted, so the walk is only done on first use and the result is kept on the node.
+        regions = self._register_regions
+        if regions is None:
+            regions = self._register_regions = self.find_register_regions()
+        return regions
+
+    def find_register_regions(self):
+        # The node is itself a register.
+        if self.region.register is not None:
+            return (self.region,)
+
+        # The node is a container, so gather all registers in its hierarchy. The walk is done in
+        # the same depth-first order as descendants, but doesn't continue past a register node,
+        # since the fields within a register are covered by the register's own region.
+        regions = []
+        stack = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if child.region.register is not None:
+                regions.append(child.region)
+            else:
+                stack.extend(reversed(child.children))
+        return tuple(regions)
@@ -3,6 +3,8 @@ __all__ = ()
 
 #---------------------------------------------------------------------------------------------------
 class Value:
+    __slots__ = ('relative', 'absolute')
+
     def __init__(self, relative, absolute, *pargs, **kargs):
         super().__init__(*pargs, **kargs)
 
@@ -18,6 +20,8 @@ class Value:
 
 #---------------------------------------------------------------------------------------------------
 class Counter:
+    __slots__ = ('value', 'regions')
+
     def __init__(self, *pargs, **kargs):
         super().__init__(*pargs, **kargs)
 
@@ -33,7 +37,10 @@ class Counter:
         return self.value.copy()
 
     def inc(self, size):
-        self.value.inc(size)
+        # Same as self.value.inc(size), inlined since this is called for every node being counted.
+        value = self.value
+        value.relative += size
+        value.absolute += size
 
     def align(self, size):
         offset = self.value.relative % size
@@ -3,6 +3,7 @@ __all__ = ()
 
 import collections.abc
 import functools
+import itertools
 
 #---------------------------------------------------------------------------------------------------
 class KeyFieldRange:
@@ -60,6 +61,9 @@ class KeyFieldRangeList:
         return self._iter(True)
 
 #---------------------------------------------------------------------------------------------------
+# Types given for a single range within a key's field.
+RANGE_TYPES = (int, slice)
+
 class Key:
     def __init__(self, indexer, fields):
         self.indexer = indexer
@@ -87,10 +91,14 @@ class Key:
         # the ranges. For each field, the expected form should be field=(range0, range1, ...), where
         # the argument is fields=(field0, field1, ...). This sequence will be appended to the end of
         # the current key's captured set.
-        if isinstance(fields, collections.abc.Sequence):
+        # Checks against concrete types are done first, since checks against the abstract sequence
+        # type are comparatively slow and the common cases are plain tuples, integers and slices.
+        if type(fields) is tuple or isinstance(fields, collections.abc.Sequence):
             # The input was already in sequence form, so wrap any non-sequence elements.
             fields = tuple(
-                field if isinstance(field, collections.abc.Sequence) else (field,)
+                (field,)
+                if type(field) in RANGE_TYPES or not isinstance(field, collections.abc.Sequence)
+                else field
                 for field in fields
             )
         else:
@@ -110,17 +118,19 @@ class Key:
         return self.indexer.new_key(fields)
 
     def to_ranges(self, fields):
-        # Pad out the missing fields with a single slice over the entire range.
-        nfields = len(fields)
-        if nfields < self.indexer.nfields:
-            fields += tuple([(slice(None, None, 1),)] * (self.indexer.nfields - nfields))
-
         # Canonicalize the ranges and wrap them up into convenience objects for use in iteration.
-        return tuple(
+        indexer = self.indexer
+        ranges = tuple(
             self.to_range_list(ranges, length)
-            for ranges, length in zip(fields, self.indexer.fields)
+            for ranges, length in zip(fields, indexer.fields)
         )
 
+        # Pad out the missing fields with a single slice over the entire range. These are the same
+        # for every key, so the indexer's pre-built range lists are used.
+        if len(ranges) < indexer.nfields:
+            ranges += indexer.full_ranges[len(ranges):]
+        return ranges
+
     def to_range_list(self, ranges, length):
         # Validate each range against the field's length and produce indices for iteration with the
         # builtin range().
@@ -169,8 +179,7 @@ class Key:
         return self.indexer.iter_key(self, reversed_)
 
     def iter_ordinal(self, reversed_=False):
-        for index in self._iter(reversed_):
-            yield self.indexer._to_ordinal(index)
+        return self.indexer.iter_key_ordinal(self, reversed_)
 
     def __iter__(self):
         return self._iter(False)
@@ -179,6 +188,9 @@ class Key:
         return self._iter(True)
 
 #---------------------------------------------------------------------------------------------------
+# Returned by next() in place of raising StopIteration when a range iterator is exhausted.
+_EXHAUSTED = object()
+
 class KeyIterator:
     def __init__(self, key, reversed_):
         self._key = key
@@ -188,9 +200,8 @@ class KeyIterator:
         iters = [iter_fn(r) for r in self._key.ranges]
 
         # Set the cursor to the first index.
-        try:
-            cursor = [next(it) for it in iters]
-        except StopIteration:
+        cursor = [next(it, _EXHAUSTED) for it in iters]
+        if _EXHAUSTED in cursor:
             # Handle empty ranges.
             self._cursor = None
         else:
@@ -217,16 +228,18 @@ class KeyIterator:
         iters = self._iters
         ranges = self._key.ranges
         for field in self._key.indexer.inc_order:
-            try:
-                # Update the range iterator for the next field to be incremented.
-                cursor[field] = next(iters[field])
-            except StopIteration:
-                # Restart the iterator on the field before advancing to the next one.
-                iters[field] = iter_fn(ranges[field])
-                cursor[field] = next(iters[field])
-            else:
+            # Update the range iterator for the next field to be incremented. Exhaustion is checked
+            # with a sentinel rather than by catching StopIteration, since it happens every time a
+            # field wraps around.
+            index_field = next(iters[field], _EXHAUSTED)
+            if index_field is not _EXHAUSTED:
                 # The cursor is set for the next iteration cycle.
+                cursor[field] = index_field
                 break
+
+            # Restart the iterator on the field before advancing to the next one.
+            iters[field] = iter_fn(ranges[field])
+            cursor[field] = next(iters[field])
         else:
             # The ranges have all been traversed.
             del self._iters
@@ -255,6 +268,14 @@ class Indexer:
         # Total number of indexable elements spanned by the length of the fields.
         self.length = self.spans[-1] * self.fields[-1]
 
+        # Range lists covering the entire length of each field. These are shared by all keys for
+        # padding out the fields missing from a partial key.
+        full = slice(None, None, 1)
+        self.full_ranges = tuple(
+            KeyFieldRangeList((KeyFieldRange(full.indices(length), True),))
+            for length in self.fields
+        )
+
     def _to_ordinal(self, index):
         # Reduce the given index to a single integer ordinal.
         return sum(span * idx for span, idx in zip(self.spans, index))
@@ -266,11 +287,13 @@ class Indexer:
 
         # Range check each component of the index against it's respective field's length. Note that
         # negative values are not supported in an index, only key fields can be negative, but must
-        # be converted to a valid range using Key.to_range.
-        if any(idx < 0 or idx >= length for idx, length in zip(index, self.fields)):
-            raise IndexError(f'Index {index!r} is out of range.')
-
-        return self._to_ordinal(index)
+        # be converted to a valid range using Key.to_range. The ordinal is reduced in the same pass.
+        ordinal = 0
+        for idx, length, span in zip(index, self.fields, self.spans):
+            if idx < 0 or idx >= length:
+                raise IndexError(f'Index {index!r} is out of range.')
+            ordinal += span * idx
+        return ordinal
 
     def _from_ordinal(self, ordinal):
         # Expand the ordinal into an index with a component for each field.
@@ -295,6 +318,22 @@ class Indexer:
     def iter_key(self, key, reversed_=False):
         return KeyIterator(key, reversed_)
 
+    # Override to replace the key ordinal iterator.
+    def iter_key_ordinal(self, key, reversed_=False):
+        # An ordinal is the sum of each index field scaled by the field's span, so rather than
+        # building every index and reducing it, pre-scale the indices of each field and sum one
+        # contribution from each. The fields are given to itertools.product in reverse of their
+        # increment order, since it advances it's last argument first. This produces the ordinals
+        # in the same order as iterating over the key's indices.
+        iter_fn = reversed if reversed_ else iter
+        ranges = key.ranges
+        spans = self.spans
+        contributions = [
+            [spans[field] * idx for idx in iter_fn(ranges[field])]
+            for field in reversed(self.inc_order)
+        ]
+        return map(sum, itertools.product(*contributions))
+
     def iter_all(self, reversed_=False):
         return self.iter_key(self.new_key(()), reversed_)
 
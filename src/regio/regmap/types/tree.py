@@ -63,7 +63,7 @@ class Node:
     @property
     def siblings(self):
         if self.parent is None:
-            raise StopIteration
+            return
 
         for node in self.parent.children:
             yield node